@@ -5,11 +5,218 @@ Includes portfolio optimization (Sharpe ratio maximization),
 random portfolio generation, and rebalancing simulation.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict
 import pandas as pd
 import numpy as np
+from scipy.linalg import cho_solve
 from scipy.optimize import minimize
-from portfolio_utils import TRADING_DAYS, portfolio_return_series, portfolio_metrics_from_returns
+from portfolio_utils import TRADING_DAYS, _cagr, _portfolio_return_matrix, _sharpe
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; simulate_rebalancing falls back to numpy
+    njit = None
+
+_PREP_CACHE_SIZE = 8
+_prep_cache = {}
+
+
+def _prep_annualized(returns: pd.DataFrame) -> tuple:
+    """
+    Annualized mean, covariance and covariance Cholesky factor, cached per returns frame.
+    
+    The cache is keyed on the frame object (plus shape and first/last date), so
+    repeated solver calls on the same frame, e.g. frontier sweeps, compute the
+    covariance once. A frame modified in place after a call is not detected.
+    
+    Args:
+        returns: DataFrame of asset daily returns
+    
+    Returns:
+        Tuple of (mean_ann, cov_ann, cov_chol) read-only arrays; cov_chol is the
+        lower Cholesky factor, or None if the covariance is not positive definite
+    """
+    key = (id(returns), returns.shape, returns.index[0], returns.index[-1])
+    cached = _prep_cache.get(key)
+    # The cached entry holds a reference to the frame, so its id cannot be reused while cached
+    if cached is not None and cached[0] is returns:
+        return cached[1]
+
+    mean_ann = np.ascontiguousarray(returns.mean().values * TRADING_DAYS)
+    cov_ann = np.ascontiguousarray(returns.cov().values * TRADING_DAYS)
+    try:
+        cov_chol = np.linalg.cholesky(cov_ann)
+        cov_chol.setflags(write=False)
+    except np.linalg.LinAlgError:
+        cov_chol = None
+    mean_ann.setflags(write=False)
+    cov_ann.setflags(write=False)
+
+    if len(_prep_cache) >= _PREP_CACHE_SIZE:
+        _prep_cache.pop(next(iter(_prep_cache)))
+    _prep_cache[key] = (returns, (mean_ann, cov_ann, cov_chol))
+    return mean_ann, cov_ann, cov_chol
+
+
+def _closed_form_target_return_weights(mean_ann: np.ndarray, cov_chol: np.ndarray, target_annual_ret: float):
+    """
+    Analytic minimum-variance weights with return >= target (Lagrange multipliers, no bounds).
+    
+    Args:
+        mean_ann: Array of annualized mean returns
+        cov_chol: Lower Cholesky factor of the annualized covariance matrix, or None
+        target_annual_ret: Target annual return as decimal
+    
+    Returns:
+        Array of weights summing to 1, or None if the covariance matrix is singular
+    """
+    if cov_chol is None:
+        return None
+    n = len(mean_ann)
+    # Sigma^-1 [1, mu] via two triangular solves instead of an explicit inverse
+    x = cho_solve((cov_chol, True), np.column_stack([np.ones(n), mean_ann]))
+    x_1, x_r = x[:, 0], x[:, 1]
+    s_11 = x_1.sum()
+    s_1r = x_r.sum()
+    s_rr = mean_ann @ x_r
+
+    # Return constraint is an inequality: the global minimum-variance portfolio wins if it already meets it
+    if s_1r / s_11 >= target_annual_ret:
+        return x_1 / s_11
+
+    det = s_11 * s_rr - s_1r ** 2
+    if det <= 0:
+        return None
+    lam_r = (s_11 * target_annual_ret - s_1r) / det
+    lam_1 = (s_rr - s_1r * target_annual_ret) / det
+    return lam_r * x_r + lam_1 * x_1
+
+
+def _project_to_bounded_simplex(w: np.ndarray, min_weight: float, max_weight: float) -> np.ndarray:
+    """
+    Euclidean projection onto {sum(w) = 1, min_weight <= w <= max_weight}.
+    
+    Finds the shift tau with sum(clip(w - tau, min_weight, max_weight)) = 1 by bisection.
+    
+    Args:
+        w: Array of weights
+        min_weight: Minimum weight per asset
+        max_weight: Maximum weight per asset
+    
+    Returns:
+        Array of projected weights
+    """
+    lo, hi = w.min() - max_weight, w.max() - min_weight
+    for _ in range(100):
+        tau = 0.5 * (lo + hi)
+        if np.clip(w - tau, min_weight, max_weight).sum() > 1.0:
+            lo = tau
+        else:
+            hi = tau
+    return np.clip(w - 0.5 * (lo + hi), min_weight, max_weight)
+
+
+def _closed_form_warm_start(
+    direction: np.ndarray,
+    cov_chol: np.ndarray,
+    min_weight: float,
+    max_weight: float
+) -> np.ndarray:
+    """
+    SLSQP starting point Sigma^-1 d / (1' Sigma^-1 d), projected onto the weight bounds.
+    
+    With d = 1 this is the minimum-variance portfolio, with d = mu - rf the tangency portfolio.
+    
+    Args:
+        direction: Array d defining the unconstrained portfolio
+        cov_chol: Lower Cholesky factor of the annualized covariance matrix, or None
+        min_weight: Minimum weight per asset
+        max_weight: Maximum weight per asset
+    
+    Returns:
+        Array of starting weights (equal weight if the closed form is not usable)
+    """
+    n = len(direction)
+    if cov_chol is None:
+        return np.full(n, 1.0 / n)
+    x = cho_solve((cov_chol, True), direction)
+    total = x.sum()
+    # A non-positive normalizer flips the portfolio (e.g. all excess returns negative)
+    if not np.isfinite(total) or total <= 0:
+        return np.full(n, 1.0 / n)
+    return _project_to_bounded_simplex(x / total, min_weight, max_weight)
+
+
+def _within_bounds(w, min_weight: float, max_weight: float) -> bool:
+    """Whether closed-form weights exist and respect [min_weight, max_weight]."""
+    return w is not None and not (np.any(w < min_weight - 1e-10) or np.any(w > max_weight + 1e-10))
+
+
+def _target_return_weights(
+    mean_ann: np.ndarray,
+    cov_ann: np.ndarray,
+    cov_chol: np.ndarray,
+    target_annual_ret: float,
+    min_weight: float,
+    max_weight: float
+) -> np.ndarray:
+    """
+    Minimum-variance weights for a target return on precomputed annualized arrays.
+    
+    Args:
+        mean_ann: Array of annualized mean returns
+        cov_ann: Annualized covariance matrix
+        cov_chol: Lower Cholesky factor of cov_ann, or None
+        target_annual_ret: Target annual return as decimal
+        min_weight: Minimum weight per asset
+        max_weight: Maximum weight per asset
+    
+    Returns:
+        Array of raw (unclipped) optimal weights
+    """
+    m, C = mean_ann, cov_ann
+    n = len(m)
+    ones = np.ones(n)
+
+    # Closed-form solution first; only fall back to SLSQP when it breaks the weight bounds
+    w = _closed_form_target_return_weights(m, cov_chol, target_annual_ret)
+    if _within_bounds(w, min_weight, max_weight):
+        return w
+
+    # Objective returns (value, gradient) so C @ w is computed once per evaluation
+    def obj(w):
+        Cw = C.dot(w)
+        return w.dot(Cw), 2 * Cw
+
+    cons = [
+        {'type': 'eq', 'fun': lambda w: np.sum(w) - 1.0, 'jac': lambda w: ones},
+        {'type': 'ineq', 'fun': lambda w: w.dot(m) - target_annual_ret, 'jac': lambda w: m}
+    ]
+    bounds = tuple((min_weight, max_weight) for _ in range(n))
+    x0 = np.array([1.0 / n] * n)
+
+    res = minimize(obj, x0, method='SLSQP', jac=True, bounds=bounds, constraints=cons, options={'ftol': 1e-9, 'maxiter': 1000})
+    if not res.success:
+        print('⚠ Optimization failed:', res.message)
+    return res.x
+
+
+# Per-process solver inputs for recommend_frontier, sent once per worker via the pool initializer
+_frontier_args = None
+
+
+def _init_frontier_worker(mean_ann, cov_ann, cov_chol, min_weight, max_weight):
+    """Pool initializer: store the shared solver inputs once per worker process."""
+    global _frontier_args
+    _frontier_args = (mean_ann, cov_ann, cov_chol, min_weight, max_weight)
+
+
+def _frontier_worker(target_annual_ret: float) -> np.ndarray:
+    """Solve one frontier target from the inputs stored by _init_frontier_worker."""
+    mean_ann, cov_ann, cov_chol, min_weight, max_weight = _frontier_args
+    return _target_return_weights(mean_ann, cov_ann, cov_chol, target_annual_ret, min_weight, max_weight)
 
 
 def recommend_weights_for_target_return(
@@ -22,7 +229,9 @@ def recommend_weights_for_target_return(
     Find portfolio weights that minimize variance while achieving target annual return.
     
     Args:
-        returns: DataFrame of asset daily returns
+        returns: DataFrame of asset daily returns. Its annualized mean/covariance are cached
+                 per frame object, so after modifying the frame in place (e.g. fillna(inplace=True))
+                 pass a new frame such as returns.copy() to avoid stale statistics
         target_annual_ret: Target annual return as decimal (e.g., 0.08 for 8%)
         min_weight: Minimum weight per asset (default 0.0 = no short sales)
         max_weight: Maximum weight per asset (default 1.0 = no leverage)
@@ -31,28 +240,74 @@ def recommend_weights_for_target_return(
         Dictionary mapping asset names to optimal weights
     """
     assets = list(returns.columns)
-    mean_ann = returns.mean() * TRADING_DAYS
-    cov_ann = returns.cov() * TRADING_DAYS
     n = len(assets)
+    m, C, L = _prep_annualized(returns)
 
-    def obj(w):
-        return float(w @ cov_ann.values @ w)
-
-    cons = [
-        {'type': 'eq', 'fun': lambda w: float(np.sum(w) - 1.0)},
-        {'type': 'ineq', 'fun': lambda w: float(w @ mean_ann.values - target_annual_ret)}
-    ]
-    bounds = tuple((min_weight, max_weight) for _ in range(n))
-    x0 = np.array([1.0 / n] * n)
-
-    res = minimize(obj, x0, method='SLSQP', bounds=bounds, constraints=cons, options={'ftol': 1e-9, 'maxiter': 1000})
-    if not res.success:
-        print('⚠ Optimization failed:', res.message)
-    w_opt = np.clip(res.x, 0, 1)
+    w = _target_return_weights(m, C, L, target_annual_ret, min_weight, max_weight)
+    w_opt = np.clip(w, 0, 1)
     w_opt = w_opt / w_opt.sum()
     return {assets[i]: float(w_opt[i]) for i in range(n)}
 
 
+def recommend_frontier(
+    returns: pd.DataFrame,
+    targets: np.ndarray,
+    min_weight: float = 0.0,
+    max_weight: float = 1.0,
+    n_jobs: int = -1
+) -> pd.DataFrame:
+    """
+    Find minimum-variance weights for each target annual return (efficient frontier sweep).
+    
+    Targets with a closed-form solution inside the weight bounds are solved directly;
+    the remaining SLSQP solves are spread over a process pool.
+    
+    Args:
+        returns: DataFrame of asset daily returns. Its annualized mean/covariance are cached
+                 per frame object, so after modifying the frame in place (e.g. fillna(inplace=True))
+                 pass a new frame such as returns.copy() to avoid stale statistics
+        targets: Array of target annual returns as decimals
+        min_weight: Minimum weight per asset (default 0.0 = no short sales)
+        max_weight: Maximum weight per asset (default 1.0 = no leverage)
+        n_jobs: Number of worker processes (default -1 = all cores, 1 = no pool)
+    
+    Returns:
+        DataFrame with one row of weights per target return (same weights as
+        recommend_weights_for_target_return)
+    """
+    assets = list(returns.columns)
+    targets = np.asarray(targets, dtype=np.float64)
+    m, C, L = _prep_annualized(returns)
+
+    weights = np.empty((len(targets), len(assets)))
+    pending = []
+    for i, target in enumerate(targets):
+        w = _closed_form_target_return_weights(m, L, target)
+        if _within_bounds(w, min_weight, max_weight):
+            weights[i] = w
+        else:
+            pending.append(i)
+
+    if pending:
+        n_workers = (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+        n_workers = min(n_workers, len(pending))
+        if n_workers <= 1:
+            results = [_target_return_weights(m, C, L, targets[i], min_weight, max_weight) for i in pending]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_frontier_worker,
+                initargs=(m, C, L, min_weight, max_weight)
+            ) as pool:
+                chunksize = max(1, len(pending) // (4 * n_workers))
+                results = list(pool.map(_frontier_worker, targets[pending], chunksize=chunksize))
+        weights[pending] = results
+
+    weights = np.clip(weights, 0, 1)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return pd.DataFrame(weights, index=pd.Index(targets, name='TargetReturn'), columns=assets)
+
+
 def recommend_weights_for_max_vol(
     returns: pd.DataFrame,
     max_annual_vol: float,
@@ -63,7 +318,9 @@ def recommend_weights_for_max_vol(
     Find portfolio weights that maximize return while keeping volatility below threshold.
     
     Args:
-        returns: DataFrame of asset daily returns
+        returns: DataFrame of asset daily returns. Its annualized mean/covariance are cached
+                 per frame object, so after modifying the frame in place (e.g. fillna(inplace=True))
+                 pass a new frame such as returns.copy() to avoid stale statistics
         max_annual_vol: Maximum annual volatility as decimal (e.g., 0.13 for 13%)
         min_weight: Minimum weight per asset (default 0.0 = no short sales)
         max_weight: Maximum weight per asset (default 1.0 = no leverage)
@@ -72,26 +329,33 @@ def recommend_weights_for_max_vol(
         Dictionary mapping asset names to optimal weights
     """
     assets = list(returns.columns)
-    mean_ann = returns.mean() * TRADING_DAYS
-    cov_ann = returns.cov() * TRADING_DAYS
     n = len(assets)
+    m, C, L = _prep_annualized(returns)
+    ones = np.ones(n)
 
     def obj(w):
-        return -float(w @ mean_ann.values)
+        return -w.dot(m), -m
 
     def vol_con(w):
-        vol = np.sqrt(float(w @ cov_ann.values @ w))
-        return max_annual_vol - vol
+        return max_annual_vol - np.sqrt(w.dot(C).dot(w))
+
+    def vol_con_jac(w):
+        Cw = C.dot(w)
+        vol = np.sqrt(w.dot(Cw))
+        if vol == 0:
+            return np.zeros(n)
+        return -Cw / vol
 
     cons = [
-        {'type': 'eq', 'fun': lambda w: float(np.sum(w) - 1.0)},
-        {'type': 'ineq', 'fun': vol_con}
+        {'type': 'eq', 'fun': lambda w: np.sum(w) - 1.0, 'jac': lambda w: ones},
+        {'type': 'ineq', 'fun': vol_con, 'jac': vol_con_jac}
     ]
 
     bounds = tuple((min_weight, max_weight) for _ in range(n))
-    x0 = np.array([1.0 / n] * n)
+    # Start from the minimum-variance portfolio, the point most likely to satisfy the vol cap
+    x0 = _closed_form_warm_start(ones, L, min_weight, max_weight)
 
-    res = minimize(obj, x0, method='SLSQP', bounds=bounds, constraints=cons, options={'ftol': 1e-9, 'maxiter': 1000})
+    res = minimize(obj, x0, method='SLSQP', jac=True, bounds=bounds, constraints=cons, options={'ftol': 1e-9, 'maxiter': 1000})
     if not res.success:
         print('⚠ Optimization failed:', res.message)
     w_opt = np.clip(res.x, 0, 1)
@@ -112,10 +376,9 @@ def weights_over_time_buy_and_hold(returns: pd.DataFrame, init_weights: dict) ->
     """
     assets = list(returns.columns)
     w0 = np.array([init_weights.get(a, 0.0) for a in assets])
-    cum = (1 + returns).cumprod()
-    values = cum.multiply(w0, axis=1)
-    weights_t = values.div(values.sum(axis=1), axis=0)
-    return weights_t
+    values = np.cumprod(1.0 + returns.values, axis=0) * w0
+    values /= values.sum(axis=1, keepdims=True)
+    return pd.DataFrame(values, index=returns.index, columns=assets)
 
 
 def simulate_rebalancing(
@@ -139,29 +402,108 @@ def simulate_rebalancing(
     assets = list(returns.columns)
     target = np.array([target_weights.get(a, 0.0) for a in assets])
 
-    weights_df = pd.DataFrame(index=returns.index, columns=assets, dtype=float)
+    # Simulate in date order (stable sort, as Grouper does) and write weights back to the input rows
+    order = None
+    dates = returns.index
+    if not dates.is_monotonic_increasing:
+        order = np.argsort(dates.values, kind='mergesort')
+        dates = dates[order]
+
+    # Row counts per rebalance period (empty periods dropped); rows of each period
+    # are contiguous in the sorted index, so the cumulative counts are period ends
+    counts = pd.Series(0, index=dates).groupby(pd.Grouper(freq=freq)).size().values
+    period_ends = np.cumsum(counts[counts > 0])
+
+    R = np.ascontiguousarray(returns.values if order is None else returns.values[order], dtype=np.float64)
+    all_weights, turnovers = _simulate_rebalance_kernel(R, period_ends, target.astype(np.float64))
+
+    if order is not None:
+        all_weights[order] = all_weights.copy()
+    weights_df = pd.DataFrame(all_weights, index=returns.index, columns=assets)
+    return weights_df, pd.Series(turnovers, index=dates[period_ends - 1].rename(None))
+
+
+def _simulate_rebalance_loop(R: np.ndarray, period_ends: np.ndarray, target: np.ndarray) -> tuple:
+    """
+    Explicit-loop rebalancing kernel, compiled with numba when it is installed.
+    
+    Args:
+        R: Array of asset daily returns (T x N)
+        period_ends: Row index (exclusive) where each rebalance period ends
+        target: Array of target weights
+    
+    Returns:
+        Tuple of (weights array T x N, turnover array per period)
+    """
+    n_rows, n_assets = R.shape
+    weights = np.empty((n_rows, n_assets))
+    turnovers = np.empty(len(period_ends))
+    # Values start with total 1 allocated according to target
+    values = target.copy()
+    start = 0
+    for k in range(len(period_ends)):
+        stop = period_ends[k]
+        for t in range(start, stop):
+            total = 0.0
+            for j in range(n_assets):
+                values[j] *= 1.0 + R[t, j]
+                total += values[j]
+            for j in range(n_assets):
+                weights[t, j] = values[j] / total
+        turnover = 0.0
+        total = 0.0
+        for j in range(n_assets):
+            turnover += abs(target[j] - weights[stop - 1, j])
+            total += values[j]
+        turnovers[k] = 0.5 * turnover
+        # rebalance
+        for j in range(n_assets):
+            values[j] = total * target[j]
+        start = stop
+    return weights, turnovers
+
+
+def _simulate_rebalance_numpy(R: np.ndarray, period_ends: np.ndarray, target: np.ndarray) -> tuple:
+    """
+    Vectorized rebalancing kernel (one cumprod per period), used without numba.
+    
+    Args:
+        R: Array of asset daily returns (T x N)
+        period_ends: Row index (exclusive) where each rebalance period ends
+        target: Array of target weights
+    
+    Returns:
+        Tuple of (weights array T x N, turnover array per period)
+    """
+    weights = np.empty(R.shape)
+    turnovers = np.empty(len(period_ends))
     # Values start with total 1 allocated according to target
     values = target.copy()
-    turnovers = {}
-
-    # Group by rebalance periods
-    for period, group in returns.groupby(pd.Grouper(freq=freq)):
-        if group.empty:
-            continue
-        for date, row in group.iterrows():
-            values = values * (1 + row.values)
-            weights_df.loc[date, assets] = values / values.sum()
-        end_date = group.index[-1]
-        pre_weights = weights_df.loc[end_date].values
-        turnover = 0.5 * np.abs(target - pre_weights).sum()
-        turnovers[end_date] = turnover
+    start = 0
+    for k, stop in enumerate(period_ends):
+        asset_values = values * np.cumprod(1 + R[start:stop], axis=0)
+        w_block = asset_values / asset_values.sum(axis=1, keepdims=True)
+        weights[start:stop] = w_block
+        turnovers[k] = 0.5 * np.abs(target - w_block[-1]).sum()
         # rebalance
-        values = values.sum() * target
+        values = asset_values[-1].sum() * target
+        start = stop
+    return weights, turnovers
+
 
-    return weights_df, pd.Series(turnovers)
+if njit is not None:
+    # error_model='numpy' gives NaN on 0/0 like the numpy kernel, instead of raising ZeroDivisionError
+    _simulate_rebalance_kernel = njit(cache=True, error_model='numpy')(_simulate_rebalance_loop)
+else:
+    _simulate_rebalance_kernel = _simulate_rebalance_numpy
 
 
-def generate_random_portfolios(returns: pd.DataFrame, num_portfolios: int = 2000, seed: int = 42) -> pd.DataFrame:
+def generate_random_portfolios(
+    returns: pd.DataFrame,
+    num_portfolios: int = 2000,
+    seed: int = 42,
+    use_float32: bool = True
+) -> pd.DataFrame:
     """
     Generate random portfolio allocations and evaluate their metrics.
     
@@ -169,6 +511,8 @@ def generate_random_portfolios(returns: pd.DataFrame, num_portfolios: int = 2000
         returns: DataFrame of asset daily returns
         num_portfolios: Number of random portfolios to generate (default 2000)
         seed: Random seed for reproducibility (default 42)
+        use_float32: If True (default), compute metrics in float32, which is accurate
+                     enough for ranking and halves memory traffic. False uses float64.
     
     Returns:
         DataFrame with one row per portfolio containing:
@@ -180,23 +524,28 @@ def generate_random_portfolios(returns: pd.DataFrame, num_portfolios: int = 2000
     n = len(assets)
     samples = np.random.dirichlet(np.ones(n), size=num_portfolios)
 
-    rows = []
-    for s in samples:
-        w = {asset: float(s[i]) for i, asset in enumerate(assets)}
-        port_rets = portfolio_return_series(returns, w)
-        mets = portfolio_metrics_from_returns(port_rets)
-        row = {
-            "CAGR": mets["CAGR"],
-            "AnnualVol": mets["AnnualVol"],
-            "Sharpe": mets["Sharpe"],
-            "MaxDrawdown": mets["MaxDrawdown"]
-        }
-        # add weights
-        for i, asset in enumerate(assets):
-            row[f"w_{asset}"] = s[i]
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
+    # Output is filled column-wise: 4 metric columns followed by the n weights
+    out = np.empty((num_portfolios, 4 + n))
+    out[:, 4:] = samples
+
+    # All portfolio return series at once: (T x N) @ (N x P) -> (T x P)
+    dtype = np.float32 if use_float32 else np.float64
+    R = np.ascontiguousarray(returns.values, dtype=dtype)
+    port_rets = _portfolio_return_matrix(R, samples.astype(dtype))
+
+    # Metrics straight from the (T x P) arrays, no per-portfolio Series
+    values = np.cumprod(1 + port_rets, axis=0)
+    days = (returns.index[-1] - returns.index[0]).days
+    stds = port_rets.std(axis=0, ddof=1)
+    out[:, 0] = _cagr(values[0], values[-1], days)
+    out[:, 1] = stds * np.sqrt(TRADING_DAYS)
+    out[:, 2] = _sharpe(port_rets.mean(axis=0), stds)
+    out[:, 3] = (values / np.maximum.accumulate(values, axis=0) - 1).min(axis=0)
+
+    df = pd.DataFrame(
+        out,
+        columns=["CAGR", "AnnualVol", "Sharpe", "MaxDrawdown"] + [f"w_{asset}" for asset in assets]
+    )
     df["Return"] = df["CAGR"]
     return df
 
@@ -211,7 +560,9 @@ def optimize_portfolio_sharpe(
     Find portfolio weights that maximize Sharpe ratio.
     
     Args:
-        returns: DataFrame of asset daily returns
+        returns: DataFrame of asset daily returns. Its annualized mean/covariance are cached
+                 per frame object, so after modifying the frame in place (e.g. fillna(inplace=True))
+                 pass a new frame such as returns.copy() to avoid stale statistics
         min_weight: Minimum weight per asset (default 0.0 = no short sales)
         max_weight: Maximum weight per asset (default 1.0 = no leverage)
         risk_free_rate: Risk-free rate for Sharpe calculation (default 0.0)
@@ -223,33 +574,35 @@ def optimize_portfolio_sharpe(
     n = len(assets)
     
     # Annualized metrics
-    mean_returns = returns.mean() * TRADING_DAYS
-    cov_matrix = returns.cov() * TRADING_DAYS
+    m, C, L = _prep_annualized(returns)
     
-    # Objective: negative Sharpe ratio (minimize to maximize Sharpe)
+    # Objective: negative Sharpe ratio (minimize to maximize Sharpe), with its gradient
     def neg_sharpe(w):
-        port_return = np.dot(w, mean_returns)
-        port_vol = np.sqrt(np.dot(w, np.dot(cov_matrix, w)))
+        Cw = C.dot(w)
+        port_vol = np.sqrt(w.dot(Cw))
         if port_vol == 0:
-            return 1e6
-        return -(port_return - risk_free_rate) / port_vol
+            return 1e6, np.zeros(n)
+        excess = w.dot(m) - risk_free_rate
+        grad = -(m / port_vol - excess * Cw / port_vol ** 3)
+        return -excess / port_vol, grad
     
     # Constraints
     constraints = [
-        {'type': 'eq', 'fun': lambda w: np.sum(w) - 1}  # weights sum to 1
+        {'type': 'eq', 'fun': lambda w: np.sum(w) - 1, 'jac': lambda w: np.ones(n)}  # weights sum to 1
     ]
     
     # Bounds: each weight between min_weight and max_weight
     bounds = tuple([(min_weight, max_weight) for _ in range(n)])
     
-    # Initial guess: equal-weight
-    x0 = np.array([1.0 / n for _ in range(n)])
+    # Initial guess: tangency portfolio projected onto the bounds
+    x0 = _closed_form_warm_start(m - risk_free_rate, L, min_weight, max_weight)
     
     # Optimize
     result = minimize(
         neg_sharpe,
         x0,
         method='SLSQP',
+        jac=True,
         bounds=bounds,
         constraints=constraints,
         options={'ftol': 1e-9, 'maxiter': 1000}
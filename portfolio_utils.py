@@ -4,6 +4,7 @@ Core portfolio analysis utilities.
 Functions for fetching prices, computing returns, and calculating portfolio metrics.
 """
 
+import bisect
 from typing import Dict, Optional
 import pandas as pd
 import numpy as np
@@ -11,6 +12,30 @@ import yfinance as yf
 
 TRADING_DAYS = 252
 
+# Historical Riksbanken repo rate as a step function: _RIKS_RATES[i] applies to dates
+# before _RIKS_DATES[i] (and on/after _RIKS_DATES[i-1]); the last rate applies afterwards.
+_RIKS_DATES = np.array([
+    '2009-01-01', '2010-07-01', '2021-01-01', '2022-04-01', '2022-09-01', '2022-11-01',
+    '2022-12-01', '2023-02-01', '2023-09-01', '2024-01-01', '2024-05-01',
+], dtype='datetime64[ns]')
+_RIKS_RATES = np.array([
+    0.035,   # 3.5% (pre-crisis)
+    0.005,   # 0.5% (crisis period)
+    0.000,   # 0.0% (ultra-low rates)
+    0.000,   # 0.0% (still near-zero)
+    0.0075,  # 0.75%
+    0.015,   # 1.5%
+    0.020,   # 2.0%
+    0.020,   # 2.0%
+    0.025,   # 2.5%
+    0.0275,  # 2.75%
+    0.035,   # 3.5%
+    0.035,   # 3.5% (current/normalized)
+])
+# Same breakpoints as Timestamps/floats for scalar bisect lookups
+_RIKS_CUTOFFS = [pd.Timestamp(d) for d in _RIKS_DATES]
+_RIKS_RATE_LIST = _RIKS_RATES.tolist()
+
 
 def fetch_prices(tickers: Dict[str, str], start: str, end: Optional[str] = None) -> pd.DataFrame:
     """
@@ -25,37 +50,24 @@ def fetch_prices(tickers: Dict[str, str], start: str, end: Optional[str] = None)
         DataFrame with dates as index and asset names as columns
     """
     yf_tickers = list(tickers.values())
-    data = yf.download(yf_tickers, start=start, end=end, progress=False)
+    # auto_adjust=True folds dividends/splits into 'Close', so no 'Adj Close' lookup is needed;
+    # group_by='column' keeps the price type as the top column level
+    data = yf.download(yf_tickers, start=start, end=end, auto_adjust=True, group_by='column',
+                       progress=False, threads=True)
     
     if data.empty:
         raise RuntimeError("No data fetched. Check tickers or date range.")
-    
-    # yfinance returns multi-level columns: (Price Type, Ticker)
-    # Extract the 'Close' or 'Adj Close' prices
-    if data.columns.nlevels > 1:
-        # Multi-level columns from yfinance
-        level_0_values = data.columns.get_level_values(0).unique()
-        
-        # Try to get 'Adj Close' first, fall back to 'Close'
-        if 'Adj Close' in level_0_values:
-            adj = data.xs('Adj Close', level=0, axis=1)
-        elif 'Close' in level_0_values:
-            adj = data.xs('Close', level=0, axis=1)
-        else:
-            raise RuntimeError(f"Could not find 'Adj Close' or 'Close' in columns. Available: {level_0_values.tolist()}")
-    elif 'Adj Close' in data.columns:
-        adj = data["Adj Close"].copy()
-    elif 'Close' in data.columns:
-        adj = data["Close"].copy()
-    else:
+    if 'Close' not in data.columns.get_level_values(0):
         raise RuntimeError("Could not find price column in downloaded data.")
     
+    adj = data['Close']
+    if isinstance(adj, pd.Series):
+        # Single ticker without a ticker column level
+        adj = adj.to_frame(name=yf_tickers[0])
+    
     # Rename columns from ticker symbols to asset names
     mapping = {tickers[k]: k for k in tickers}
-    try:
-        adj = adj.rename(columns=mapping)
-    except:
-        pass
+    adj.columns = adj.columns.map(lambda c: mapping.get(c, c))
     
     adj = adj.sort_index()
     return adj
@@ -73,7 +85,21 @@ def compute_returns(prices: pd.DataFrame, method: str = "log") -> pd.DataFrame:
         DataFrame of returns
     """
     if method == "log":
-        return np.log(prices / prices.shift(1)).dropna()
+        if len(prices) < 2:
+            return prices.iloc[0:0]
+        # log(p[t] / p[t-1]) computed in one preallocated buffer, no shift/dropna copies
+        v = prices.to_numpy(dtype=np.float64)
+        out = np.empty((v.shape[0] - 1,) + v.shape[1:])
+        np.divide(v[1:], v[:-1], out=out)
+        np.log(out, out=out)
+        if out.ndim == 1:
+            rets = pd.Series(out, index=prices.index[1:], name=prices.name)
+        else:
+            rets = pd.DataFrame(out, index=prices.index[1:], columns=prices.columns)
+        # Only pay for dropna when there are gaps in the prices
+        if np.isnan(out).any():
+            rets = rets.dropna()
+        return rets
     else:
         return prices.pct_change().dropna()
 
@@ -89,12 +115,9 @@ def apply_annual_fees(returns: pd.DataFrame, annual_fees: Dict[str, float]) -> p
     Returns:
         DataFrame of net returns after fees deducted daily
     """
-    daily_fees = {k: (1 + v) ** (1 / TRADING_DAYS) - 1 for k, v in annual_fees.items()}
-    net = returns.copy()
-    for col in net.columns:
-        fee = daily_fees.get(col, 0.0)
-        net[col] = net[col] - fee
-    return net
+    fee_vec = np.array([(1 + annual_fees.get(c, 0.0)) ** (1 / TRADING_DAYS) - 1 for c in returns.columns])
+    net_vals = returns.values - fee_vec[None, :]
+    return pd.DataFrame(net_vals, index=returns.index, columns=returns.columns)
 
 
 def apply_isk_simple_tax_on_annual(values: pd.Series, annual_tax_rate: float) -> pd.Series:
@@ -108,13 +131,23 @@ def apply_isk_simple_tax_on_annual(values: pd.Series, annual_tax_rate: float) ->
     Returns:
         Series of after-tax values
     """
-    vals = values.copy()
-    yrs = vals.index.year
-    year_ends = vals.groupby(yrs).apply(lambda s: s.index[-1])
-    for idx in year_ends:
-        tax_base = vals.loc[idx]
-        vals.loc[idx:] = vals.loc[idx:] - (annual_tax_rate * tax_base)
-    return vals
+    if values.empty:
+        return values.copy()
+    vals_arr = values.to_numpy(dtype=np.float64, copy=True)
+    yrs = values.index.year.values
+    year_ends = np.flatnonzero(np.diff(yrs, append=yrs[-1] + 1) != 0)
+
+    # Each year-end tax is deducted from all later values, so carry the running
+    # deduction forward segment by segment instead of rewriting the tail every year
+    deduct = 0.0
+    start = 0
+    for e in year_ends:
+        vals_arr[start:e] -= deduct
+        tax_base = vals_arr[e] - deduct
+        deduct += annual_tax_rate * tax_base
+        vals_arr[e] -= deduct
+        start = e + 1
+    return pd.Series(vals_arr, index=values.index, name=values.name)
 
 
 def portfolio_return_series(returns: pd.DataFrame, weights: Dict[str, float]) -> pd.Series:
@@ -130,8 +163,22 @@ def portfolio_return_series(returns: pd.DataFrame, weights: Dict[str, float]) ->
     """
     cols = list(weights.keys())
     w = np.array([weights[c] for c in cols])
-    rets = returns[cols].dot(w)
-    return rets
+    rets = _portfolio_return_matrix(returns[cols].values, w)
+    return pd.Series(rets, index=returns.index)
+
+
+def _portfolio_return_matrix(R: np.ndarray, W: np.ndarray) -> np.ndarray:
+    """
+    Portfolio returns for raw arrays, skipping pandas column alignment.
+    
+    Args:
+        R: Array of asset returns (T x N)
+        W: Weights, either one portfolio (N,) or many portfolios (P x N)
+    
+    Returns:
+        Array of portfolio returns, (T,) or (T x P)
+    """
+    return R @ W.T
 
 
 def get_historical_riksbanken_rate(date: pd.Timestamp) -> float:
@@ -142,31 +189,7 @@ def get_historical_riksbanken_rate(date: pd.Timestamp) -> float:
     Returns:
         Annual repo rate as decimal (e.g., 0.035 for 3.5%)
     """
-    # Historical Riksbanken repo rate changes
-    if date < pd.Timestamp('2009-01-01'):
-        return 0.035  # 3.5% (pre-crisis)
-    elif date < pd.Timestamp('2010-07-01'):
-        return 0.005  # 0.5% (crisis period)
-    elif date < pd.Timestamp('2021-01-01'):
-        return 0.000  # 0.0% (ultra-low rates)
-    elif date < pd.Timestamp('2022-04-01'):
-        return 0.000  # 0.0% (still near-zero)
-    elif date < pd.Timestamp('2022-09-01'):
-        return 0.0075  # 0.75%
-    elif date < pd.Timestamp('2022-11-01'):
-        return 0.015  # 1.5%
-    elif date < pd.Timestamp('2022-12-01'):
-        return 0.020  # 2.0%
-    elif date < pd.Timestamp('2023-02-01'):
-        return 0.020  # 2.0%
-    elif date < pd.Timestamp('2023-09-01'):
-        return 0.025  # 2.5%
-    elif date < pd.Timestamp('2024-01-01'):
-        return 0.0275  # 2.75%
-    elif date < pd.Timestamp('2024-05-01'):
-        return 0.035  # 3.5%
-    else:
-        return 0.035  # 3.5% (current/normalized)
+    return _RIKS_RATE_LIST[bisect.bisect_right(_RIKS_CUTOFFS, date)]
 
 
 def add_cash_returns(returns: pd.DataFrame, cash_rate=None, bank_margin: float = 0.0075, 
@@ -176,7 +199,8 @@ def add_cash_returns(returns: pd.DataFrame, cash_rate=None, bank_margin: float =
     Can use constant rate OR time-varying Riksbanken-based rates.
     
     Args:
-        returns: DataFrame of asset returns
+        returns: DataFrame of asset returns (DatetimeIndex for Riksbanken rates; tz-aware
+                 dates are matched on their local calendar date)
         cash_rate: Fixed annual cash rate (e.g., 0.01 for 1%). 
                    If None and use_riksbanken=True, uses Riksbanken rates.
         bank_margin: Bank margin over repo rate (default 0.75%). Only used with Riksbanken rates.
@@ -186,30 +210,49 @@ def add_cash_returns(returns: pd.DataFrame, cash_rate=None, bank_margin: float =
     Returns:
         DataFrame with 'Cash' column added
     """
-    out = returns.copy()
-    
     if use_riksbanken and cash_rate is None:
         # Time-varying rates based on Riksbanken repo rate + bank margin
-        cash_rates = []
-        for date in returns.index:
-            repo_rate = get_historical_riksbanken_rate(date)
-            effective_rate = repo_rate + bank_margin
-            daily_rate = (1 + effective_rate) ** (1 / trading_days) - 1
-            cash_rates.append(daily_rate)
-        out['Cash'] = pd.Series(cash_rates, index=returns.index)
+        if not isinstance(returns.index, pd.DatetimeIndex):
+            raise TypeError(
+                f"Riksbanken cash rates need a DatetimeIndex, got {type(returns.index).__name__}. "
+                "Pass cash_rate for a constant rate instead."
+            )
+        # Breakpoints are calendar dates, so compare on local wall-clock time, not UTC instants
+        dates = returns.index.tz_localize(None).values.astype('datetime64[ns]')
+        repo_rates = _RIKS_RATES[np.searchsorted(_RIKS_DATES, dates, side='right')]
+        daily_cash = (1 + repo_rates + bank_margin) ** (1 / trading_days) - 1
     else:
         # Constant rate (backward compatible)
         if cash_rate is None:
             cash_rate = 0.02  # Default fallback
         daily_cash = (1 + cash_rate) ** (1 / trading_days) - 1
-        cash_col = pd.Series(daily_cash, index=returns.index, name='Cash')
+    cash_col = pd.Series(daily_cash, index=returns.index, name='Cash')
+
+    if 'Cash' in returns.columns:
+        # Replace an existing Cash column in place in the copy, keeping column order
+        out = returns.copy()
         out['Cash'] = cash_col
-    
+        return out
+    # Append the column without first copying all of returns; concat drops the columns name
+    out = pd.concat([returns, cash_col], axis=1)
+    out.columns.name = returns.columns.name
     return out
 
 
 # Metric calculation functions
 
+def _cagr(start_val, end_val, days):
+    """CAGR from start/end values over a span of calendar days; works on scalars or arrays."""
+    return (end_val / start_val) ** (365.25 / days) - 1
+
+
+def _sharpe(mean_daily, std_daily, risk_free: float = 0.0):
+    """Annualized Sharpe from daily mean/std; works on scalars or arrays (NaN where std is 0)."""
+    ann_vol = std_daily * np.sqrt(TRADING_DAYS)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(ann_vol != 0, (mean_daily * TRADING_DAYS - risk_free) / ann_vol, np.nan)
+
+
 def cagr_from_value_series(values: pd.Series) -> float:
     """
     Calculate Compound Annual Growth Rate from cumulative values.
@@ -221,8 +264,8 @@ def cagr_from_value_series(values: pd.Series) -> float:
         CAGR as a decimal (e.g., 0.08 for 8%)
     """
     days = (values.index[-1] - values.index[0]).days
-    years = days / 365.25
-    return (values.iloc[-1] / values.iloc[0]) ** (1 / years) - 1
+    v = values.values
+    return _cagr(v[0], v[-1], days)
 
 
 def max_drawdown(values: pd.Series) -> float:
@@ -230,15 +273,23 @@ def max_drawdown(values: pd.Series) -> float:
     Calculate maximum drawdown from cumulative values.
     
     Args:
-        values: Series of cumulative portfolio values
+        values: Series of cumulative portfolio values (NaNs are skipped; a DataFrame
+                gives one drawdown per column)
     
     Returns:
         Maximum drawdown as a decimal (e.g., -0.25 for 25% drawdown)
     """
-    cum = values / values.iloc[0]
-    roll_max = cum.cummax()
-    dd = (cum / roll_max) - 1
-    return dd.min()
+    # Normalizing by the first value cancels out in v / running_max.
+    # fmax/fmin skip NaNs like pandas cummax()/min(); a DataFrame is reduced per column.
+    v = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dd = v / np.fmax.accumulate(v, axis=0) - 1.0
+    mdd = np.fmin.reduce(dd, axis=0)
+    # A NaN first value made every normalized value NaN
+    mdd = np.where(np.isnan(v[0]), np.nan, mdd)
+    if isinstance(values, pd.DataFrame):
+        return pd.Series(mdd, index=values.columns)
+    return np.float64(mdd)
 
 
 def annualized_vol(returns: pd.Series) -> float:
@@ -265,9 +316,7 @@ def sharpe_ratio(returns: pd.Series, risk_free: float = 0.0) -> float:
     Returns:
         Sharpe ratio (excess return per unit of volatility)
     """
-    ann_ret = returns.mean() * TRADING_DAYS
-    ann_vol = annualized_vol(returns)
-    return (ann_ret - risk_free) / ann_vol if ann_vol != 0 else np.nan
+    return float(_sharpe(returns.mean(), returns.std(), risk_free))
 
 
 def portfolio_metrics_from_returns(portfolio_rets: pd.Series, start_value: float = 1.0, risk_free: float = 0.0) -> Dict[str, float]: